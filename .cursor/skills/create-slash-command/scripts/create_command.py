@@ -4,14 +4,23 @@ Create a new slash command file in .agents/commands/
 
 Usage:
     create_command.py <command-name> [--workflow <workflow-name>]
+    create_command.py --all [--dry-run]
 
 Examples:
     create_command.py my-new-command
     create_command.py research --workflow research
+    create_command.py --all
+
+--all scans .devagent/core/workflows/ and, for every workflow without a
+command, creates .agents/commands/<workflow>.md and its .cursor/commands/
+symlink in one pass.
 """
 
+import os
 import sys
 from pathlib import Path
+from create_symlink import create_symlink
+from project_paths import print_root_not_found, resolve_project_paths
 
 
 COMMAND_TEMPLATE = """# {command_title} (Command)
@@ -35,13 +44,22 @@ def title_case_command_name(command_name):
     return ' '.join(word.capitalize() for word in command_name.split('-'))
 
 
-def create_command(command_name, workflow_name=None):
+def resolve_paths():
+    """Resolve the project paths from this script's location, printing an error if not found."""
+    project_paths = resolve_project_paths(Path(__file__).resolve().parent)
+    if project_paths is None:
+        print_root_not_found()
+    return project_paths
+
+
+def create_command(command_name, workflow_name=None, project_paths=None):
     """
     Create a new command file in .agents/commands/
 
     Args:
         command_name: Name of the command (kebab-case)
         workflow_name: Name of the workflow file (defaults to command_name)
+        project_paths: Resolved ProjectPaths, if already known (resolved from this script otherwise)
 
     Returns:
         Path to created command file, or None if error
@@ -50,23 +68,18 @@ def create_command(command_name, workflow_name=None):
     if workflow_name is None:
         workflow_name = command_name
 
-    # Determine paths - find project root by looking for .agents directory
-    script_path = Path(__file__).resolve()
-    current = script_path.parent
-    project_root = None
-    
-    # Walk up the directory tree to find project root (contains .agents directory)
-    while current != current.parent:
-        if (current / '.agents').exists():
-            project_root = current
-            break
-        current = current.parent
-    
-    if project_root is None:
-        print("❌ Error: Could not find project root (directory containing .agents/)")
+    if project_paths is None:
+        project_paths = resolve_paths()
+        if project_paths is None:
+            return None
+
+    workflow_file = project_paths.workflows / f'{workflow_name}.md'
+    if not workflow_file.exists():
+        print(f"❌ Error: Workflow file does not exist: {workflow_file}")
+        print("   Create the workflow first, or pass --workflow <workflow-name>")
         return None
-    
-    commands_dir = project_root / '.agents' / 'commands'
+
+    commands_dir = project_paths.agents_commands
     command_file = commands_dir / f'{command_name}.md'
 
     # Check if command already exists
@@ -93,22 +106,149 @@ def create_command(command_name, workflow_name=None):
         return None
 
 
+def plan_command(name, project_paths):
+    """
+    Decide what batch mode should do for one workflow.
+
+    Returns:
+        Tuple of (action, reason), where action is 'create', 'link', 'skip' or 'conflict'
+    """
+    project_root = project_paths.root
+    agents_command = project_paths.agents_commands / f'{name}.md'
+    core_command = project_paths.core_commands / f'{name}.md'
+    symlink_path = project_paths.cursor_commands / f'{name}.md'
+
+    if agents_command.exists():
+        if not symlink_path.exists() and not symlink_path.is_symlink():
+            return 'link', "command exists, symlink missing"
+        if symlink_path.is_symlink() and symlink_path.resolve() == agents_command.resolve():
+            return 'skip', "command and symlink exist"
+        return 'conflict', f"{symlink_path} does not point to {agents_command}"
+
+    if symlink_path.is_symlink() and not symlink_path.exists():
+        return 'conflict', f"broken symlink {symlink_path} -> {os.readlink(symlink_path)}"
+    if symlink_path.exists():
+        target = symlink_path.resolve()
+        # Show targets inside the worktree relative to it; anything else stays absolute
+        if target.is_relative_to(project_root):
+            target = target.relative_to(project_root)
+        return 'skip', f"provided by {target}"
+    if core_command.exists():
+        return 'skip', f"provided by {core_command.relative_to(project_root)}"
+    return 'create', "no command for workflow"
+
+
+def create_missing_commands(dry_run=False):
+    """
+    Create commands and .cursor/commands/ symlinks for every workflow that lacks one.
+
+    Args:
+        dry_run: Report what would happen without writing anything
+
+    Returns:
+        Dict mapping 'created', 'skipped' and 'conflicting' to lists of
+        (name, reason) tuples, or None if the project root cannot be found
+    """
+    project_paths = resolve_paths()
+    if project_paths is None:
+        return None
+
+    workflows_dir = project_paths.workflows
+    results = {'created': [], 'skipped': [], 'conflicting': []}
+
+    for workflow_file in sorted(workflows_dir.glob('*.md')):
+        name = workflow_file.stem
+        action, reason = plan_command(name, project_paths)
+
+        if action == 'skip':
+            results['skipped'].append((name, reason))
+            continue
+        if action == 'conflict':
+            results['conflicting'].append((name, reason))
+            continue
+
+        if dry_run:
+            results['created'].append((name, f"would create ({reason})"))
+            continue
+
+        if action == 'create' and create_command(name, project_paths=project_paths) is None:
+            results['conflicting'].append((name, "command file could not be created"))
+            continue
+        if create_symlink(name, project_paths=project_paths) is None:
+            results['conflicting'].append((name, "symlink could not be created"))
+            continue
+        results['created'].append((name, "command and symlink" if action == 'create' else "symlink"))
+
+    return results
+
+
+def print_batch_report(results):
+    """Print the created / skipped / conflicting summary of a batch run."""
+    icons = {'created': '✅', 'skipped': 'ℹ️ ', 'conflicting': '⚠️ '}
+    for status in ('created', 'skipped', 'conflicting'):
+        entries = results[status]
+        print(f"\n{icons[status]} {status.capitalize()} ({len(entries)})")
+        for name, reason in entries:
+            print(f"   {name}: {reason}")
+
+
+def print_usage():
+    print("Usage: create_command.py <command-name> [--workflow <workflow-name>]")
+    print("       create_command.py --all [--dry-run]")
+    print("\nExamples:")
+    print("  create_command.py my-new-command")
+    print("  create_command.py research --workflow research")
+    print("  create_command.py --all")
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: create_command.py <command-name> [--workflow <workflow-name>]")
-        print("\nExamples:")
-        print("  create_command.py my-new-command")
-        print("  create_command.py research --workflow research")
+    args = sys.argv[1:]
+    if not args:
+        print_usage()
         sys.exit(1)
 
-    command_name = sys.argv[1]
+    if '--all' in args or '--dry-run' in args:
+        unknown = [arg for arg in args if arg not in ('--all', '--dry-run')]
+        if unknown or '--all' not in args:
+            problem = f"Unknown argument(s) for --all: {' '.join(unknown)}" if unknown else "--dry-run requires --all"
+            print(f"❌ Error: {problem}")
+            print_usage()
+            sys.exit(1)
+
+        dry_run = '--dry-run' in args
+        print("🚀 Creating commands for all workflows in .devagent/core/workflows/")
+        if dry_run:
+            print("   (dry run - no files will be written)")
+        print()
+
+        results = create_missing_commands(dry_run)
+        if results is None:
+            sys.exit(1)
+        print_batch_report(results)
+        if results['created'] and not dry_run:
+            print("\nNext steps:")
+            print("1. Update .agents/commands/README.md with the new commands")
+        sys.exit(1 if results['conflicting'] else 0)
+
+    command_name = args[0]
     workflow_name = None
+    if command_name.startswith('-'):
+        print(f"❌ Error: Unknown option: {command_name}")
+        print_usage()
+        sys.exit(1)
 
     # Parse optional workflow argument
-    if '--workflow' in sys.argv:
-        idx = sys.argv.index('--workflow')
-        if idx + 1 < len(sys.argv):
-            workflow_name = sys.argv[idx + 1]
+    rest = args[1:]
+    if rest == ['--workflow']:
+        print("❌ Error: --workflow requires a value")
+        print_usage()
+        sys.exit(1)
+    if rest[:1] == ['--workflow'] and len(rest) == 2:
+        workflow_name = rest[1]
+    elif rest:
+        print(f"❌ Error: Unexpected argument(s): {' '.join(rest)}")
+        print_usage()
+        sys.exit(1)
 
     print(f"🚀 Creating command: {command_name}")
     if workflow_name:
@@ -12,36 +12,29 @@ Examples:
 
 import sys
 from pathlib import Path
+from project_paths import print_root_not_found, resolve_project_paths
 
 
-def create_symlink(command_name):
+def create_symlink(command_name, project_paths=None):
     """
     Create a symlink for a command file.
 
     Args:
         command_name: Name of the command (kebab-case)
+        project_paths: Resolved ProjectPaths, if already known (resolved from this script otherwise)
 
     Returns:
         Path to created symlink, or None if error
     """
-    # Determine paths - find project root by looking for .agents directory
-    script_path = Path(__file__).resolve()
-    current = script_path.parent
-    project_root = None
-    
-    # Walk up the directory tree to find project root (contains .agents directory)
-    while current != current.parent:
-        if (current / '.agents').exists():
-            project_root = current
-            break
-        current = current.parent
-    
-    if project_root is None:
-        print("❌ Error: Could not find project root (directory containing .agents/)")
+    if project_paths is None:
+        project_paths = resolve_project_paths(Path(__file__).resolve().parent)
+
+    if project_paths is None:
+        print_root_not_found()
         return None
-    
-    agents_commands_dir = project_root / '.agents' / 'commands'
-    cursor_commands_dir = project_root / '.cursor' / 'commands'
+
+    agents_commands_dir = project_paths.agents_commands
+    cursor_commands_dir = project_paths.cursor_commands
     command_file = agents_commands_dir / f'{command_name}.md'
     symlink_path = cursor_commands_dir / f'{command_name}.md'
 
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Project root and path resolution shared by the skill scripts
+
+Resolution order:
+    1. DEVAGENT_PROJECT_ROOT environment variable, if set
+    2. Cached root for the starting directory, if it still contains .agents/ or
+       .devagent/ and no directory between the two has changed since it was found
+    3. Walk up from the starting directory to the first directory containing .agents/ or .devagent/
+
+Resolved roots are memoized in-process and persisted in
+$DEVAGENT_CACHE_DIR/project-paths.json (default: $XDG_CACHE_HOME/devagent or
+~/.cache/devagent). Each worktree root records the starting directories
+resolved to it, with the mtimes of the directories in between: creating a
+marker in any of them changes its mtime, so a cache hit needs one stat per
+level and no marker probes, and a nearer root still wins. Roots are kept most
+recently discovered first, capped at MAX_CACHED_ROOTS with MAX_CACHED_STARTS
+starting directories each; roots that lost their marker are dropped.
+
+Usage:
+    project_paths.py [start-directory]    # Print the resolved paths
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+ENV_PROJECT_ROOT = 'DEVAGENT_PROJECT_ROOT'
+ENV_CACHE_DIR = 'DEVAGENT_CACHE_DIR'
+CACHE_FILENAME = 'project-paths.json'
+CACHE_VERSION = 3
+MAX_CACHED_ROOTS = 64
+MAX_CACHED_STARTS = 32
+ROOT_MARKERS = ('.agents', '.devagent')
+
+# Key directories, relative to the project root
+KEY_DIRS = {
+    'agents_commands': '.agents/commands',
+    'cursor_commands': '.cursor/commands',
+    'core_commands': '.devagent/core/commands',
+    'workflows': '.devagent/core/workflows',
+    'skills': 'ai-rules/skills',
+}
+
+_resolved = {}
+
+
+class ProjectPaths:
+    """Project root of a worktree and its key directories."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        for name, rel_path in KEY_DIRS.items():
+            setattr(self, name, self.root / rel_path)
+
+    def __repr__(self):
+        return f"ProjectPaths({str(self.root)!r})"
+
+
+def is_project_root(path):
+    """Return True if path contains one of the root marker directories."""
+    return any((Path(path) / marker).is_dir() for marker in ROOT_MARKERS)
+
+
+def cache_file():
+    """Return the path of the persistent resolution cache."""
+    cache_dir = os.environ.get(ENV_CACHE_DIR)
+    if not cache_dir:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        cache_dir = Path(base) / 'devagent'
+    return Path(cache_dir) / CACHE_FILENAME
+
+
+def load_cache():
+    """
+    Read the persistent cache, returning an empty mapping if it is missing or unreadable.
+
+    Returns:
+        Dict mapping each root to a dict of {starting directory: mtimes of the
+        directories from there up to, but not including, the root}
+    """
+    try:
+        data = json.loads(cache_file().read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+    roots = data.get('roots')
+    if not isinstance(roots, dict):
+        return {}
+    return {root: starts for root, starts in roots.items() if isinstance(starts, dict)}
+
+
+def save_cache(roots):
+    """Write the persistent cache atomically; a read-only cache location is not an error."""
+    path = cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{CACHE_FILENAME}.')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': CACHE_VERSION, 'roots': roots}, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def dir_mtime(path):
+    """Return the mtime of a directory in nanoseconds, or None if it cannot be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def find_project_root(start, mtimes=None):
+    """
+    Walk up from start to the first directory containing a root marker.
+
+    Args:
+        start: Directory to start from
+        mtimes: Optional list to append the mtime of every directory passed on
+            the way, read before its markers are checked
+
+    Returns:
+        Path of the project root, or None if none is found
+    """
+    current = Path(start)
+    while current != current.parent:
+        if mtimes is not None:
+            mtimes.append(dir_mtime(current))
+        if is_project_root(current):
+            if mtimes is not None:
+                mtimes.pop()
+            return current
+        current = current.parent
+    return None
+
+
+def cached_project_root(start, roots):
+    """
+    Look up a starting directory in the cache, validating the hit.
+
+    Returns:
+        Tuple of (cached root or None, set of cached roots that lost their marker)
+    """
+    key = str(start)
+    stale = set()
+    for root, starts in roots.items():
+        recorded = starts.get(key)
+        root = Path(root)
+        if not isinstance(recorded, list) or (root != start and root not in start.parents):
+            continue
+        if not is_project_root(root):
+            stale.add(str(root))
+            continue
+        # A marker created between start and root changes that directory's mtime
+        between = [start, *start.parents][:len(start.parts) - len(root.parts)]
+        if [dir_mtime(path) for path in between] == recorded:
+            return root, stale
+        break
+    return None, stale
+
+
+def record_start(roots, root, start, mtimes):
+    """Return the cache with start recorded first under root, most recently discovered roots first."""
+    root, start = str(root), str(start)
+    starts = {start: mtimes}
+    starts.update((s, m) for s, m in roots.get(root, {}).items() if s != start)
+    updated = {root: dict(list(starts.items())[:MAX_CACHED_STARTS])}
+    for other, other_starts in roots.items():
+        remaining = {s: m for s, m in other_starts.items() if s != start}
+        if other != root and remaining:
+            updated[other] = remaining
+    return dict(list(updated.items())[:MAX_CACHED_ROOTS])
+
+
+def resolve_project_paths(start=None):
+    """
+    Resolve the project root for a starting directory.
+
+    Args:
+        start: Directory to resolve from (defaults to the current directory)
+
+    Returns:
+        ProjectPaths, or None if no project root can be found
+    """
+    override = os.environ.get(ENV_PROJECT_ROOT)
+    if override:
+        root = Path(override).expanduser().resolve()
+        return ProjectPaths(root) if is_project_root(root) else None
+
+    start = Path(start or Path.cwd()).resolve()
+    key = str(start)
+    if key in _resolved:
+        return _resolved[key]
+
+    roots = load_cache()
+    root, stale = cached_project_root(start, roots)
+    # A valid hit returns without walking or writing the cache
+    if root is None or stale:
+        roots = {r: starts for r, starts in roots.items() if r not in stale}
+        if root is None:
+            mtimes = []
+            root = find_project_root(start, mtimes)
+            if root is not None:
+                roots = record_start(roots, root, start, mtimes)
+        if root is not None or stale:
+            save_cache(roots)
+    if root is None:
+        return None
+
+    _resolved[key] = ProjectPaths(root)
+    return _resolved[key]
+
+
+def print_root_not_found():
+    """Print why no project root was found, distinguishing a bad override from a failed search."""
+    markers = ' or '.join(f"{marker}/" for marker in ROOT_MARKERS)
+    override = os.environ.get(ENV_PROJECT_ROOT)
+    if override:
+        print(f"❌ Error: {ENV_PROJECT_ROOT} is set to {override}, which does not contain {markers}")
+        print(f"   Fix or unset {ENV_PROJECT_ROOT}")
+    else:
+        print(f"❌ Error: Could not find project root (directory containing {markers})")
+        print(f"   Set {ENV_PROJECT_ROOT} to override")
+
+
+def main():
+    start = sys.argv[1] if len(sys.argv) > 1 else None
+    paths = resolve_project_paths(start)
+    if paths is None:
+        print_root_not_found()
+        sys.exit(1)
+
+    print(f"root: {paths.root}")
+    for name in KEY_DIRS:
+        print(f"{name}: {getattr(paths, name)}")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ Skill Initializer - Creates a new skill from template
 Usage:
     init_skill.py <skill-name> [--path <path>]
 
-Default path: ai-rules/skills (recommended for multi-agent support)
+Default path: ai-rules/skills (recommended for multi-agent support), resolved
+against the project root so the skill lands there from any subdirectory
 
 Examples:
     init_skill.py my-new-skill                    # Creates in ai-rules/skills/my-new-skill
@@ -15,6 +16,7 @@ Examples:
 
 import sys
 from pathlib import Path
+from project_paths import resolve_project_paths
 
 
 SKILL_TEMPLATE = """---
@@ -321,6 +323,9 @@ def main():
     print(f"   Location: {path}")
     if path == DEFAULT_PATH:
         print(f"   (Using default - recommended for multi-agent support)")
+        project_paths = resolve_project_paths()
+        if project_paths is not None:
+            path = str(project_paths.skills)
     print()
 
     result = init_skill(skill_name, path)
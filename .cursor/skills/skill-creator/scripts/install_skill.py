@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Skill Installer - Extracts a single skill from a .skills bundle
+
+Usage:
+    install_skill.py <bundle.skills> --list
+    install_skill.py <bundle.skills> <skill-name> [--path <path>]
+
+Default path: ai-rules/skills (recommended for multi-agent support), resolved
+against the project root
+
+Examples:
+    install_skill.py dist/catalog.skills --list
+    install_skill.py dist/catalog.skills my-skill                 # Installs to ai-rules/skills/my-skill
+    install_skill.py dist/catalog.skills my-skill --path .cursor/skills
+
+Only the manifest and the blobs used by the requested skill are read from the
+bundle; the zip central directory gives random access to each blob.
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from project_paths import resolve_project_paths
+from package_skill import BUNDLE_FORMAT, BUNDLE_VERSION, BUNDLE_MANIFEST, HASH_CHUNK_SIZE, blob_name
+
+
+def read_bundle_manifest(zipf):
+    """
+    Read and check the manifest of an open bundle.
+
+    Returns:
+        Manifest dictionary, or None if the archive is not a supported bundle
+    """
+    try:
+        manifest = json.loads(zipf.read(BUNDLE_MANIFEST))
+    except KeyError:
+        print(f"❌ Error: {BUNDLE_MANIFEST} not found; not a skill bundle")
+        return None
+    except json.JSONDecodeError as e:
+        print(f"❌ Error: Invalid {BUNDLE_MANIFEST}: {e}")
+        return None
+
+    if manifest.get('format') != BUNDLE_FORMAT:
+        print(f"❌ Error: Unknown bundle format: {manifest.get('format')}")
+        return None
+    if manifest.get('version') != BUNDLE_VERSION:
+        print(f"❌ Error: Unsupported bundle version: {manifest.get('version')}")
+        return None
+    skills = manifest.get('skills')
+    if not isinstance(skills, dict) or not all(
+            isinstance(skill, dict) and isinstance(skill.get('files'), dict) for skill in skills.values()):
+        print(f"❌ Error: Invalid {BUNDLE_MANIFEST}: missing or malformed 'skills'")
+        return None
+    return manifest
+
+
+def list_bundle(bundle_path):
+    """
+    List the skills in a bundle.
+
+    Returns:
+        List of skill names, or None if error
+    """
+    try:
+        with zipfile.ZipFile(bundle_path) as zipf:
+            manifest = read_bundle_manifest(zipf)
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"❌ Error reading bundle: {e}")
+        return None
+    if manifest is None:
+        return None
+    return sorted(manifest['skills'])
+
+
+def install_skill(bundle_path, skill_name, path):
+    """
+    Extract one skill from a bundle, verifying each file against its digest.
+
+    Files are extracted into a temporary directory next to the target, which is
+    moved into place only once every digest matches; on any failure it is
+    removed, so nothing is left behind to block a retry.
+
+    Args:
+        bundle_path: Path to the .skills bundle
+        skill_name: Name of the skill to extract
+        path: Directory the skill directory should be created in
+
+    Returns:
+        Path to the installed skill directory, or None if error
+    """
+    skill_dir = Path(path).resolve() / skill_name
+
+    # Check if directory already exists
+    if skill_dir.exists():
+        print(f"❌ Error: Skill directory already exists: {skill_dir}")
+        return None
+
+    staging_dir = None
+    try:
+        with zipfile.ZipFile(bundle_path) as zipf:
+            manifest = read_bundle_manifest(zipf)
+            if manifest is None:
+                return None
+
+            skill = manifest['skills'].get(skill_name)
+            if skill is None:
+                print(f"❌ Error: Skill '{skill_name}' not found in bundle")
+                print(f"   Available skills: {', '.join(sorted(manifest['skills']))}")
+                return None
+
+            skill_dir.parent.mkdir(parents=True, exist_ok=True)
+            staging_dir = Path(tempfile.mkdtemp(dir=skill_dir.parent, prefix=f'.{skill_name}.'))
+
+            for rel_path, digest in sorted(skill['files'].items()):
+                rel = PurePosixPath(rel_path)
+                if not rel.parts or rel.is_absolute() or '..' in rel.parts:
+                    print(f"❌ Error: Unsafe path in bundle manifest: {rel_path!r}")
+                    return None
+
+                target = staging_dir.joinpath(*rel.parts)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                hasher = hashlib.sha256()
+                with zipf.open(blob_name(digest)) as src, open(target, 'wb') as dst:
+                    for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+                        dst.write(chunk)
+                if hasher.hexdigest() != digest:
+                    print(f"❌ Error: Digest mismatch for {rel_path}; bundle is corrupt")
+                    return None
+
+                # Keep scripts executable, mirroring init_skill.py
+                if rel.parts[0] == 'scripts' and rel.suffix in ('.py', '.sh'):
+                    target.chmod(0o755)
+                print(f"  Extracted: {skill_name}/{rel_path}")
+
+        # mkdtemp creates the directory owner-only; give it normal directory permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        staging_dir.chmod(0o777 & ~umask)
+        os.replace(staging_dir, skill_dir)
+        staging_dir = None
+
+    except (OSError, KeyError, zipfile.BadZipFile) as e:
+        print(f"❌ Error extracting skill: {e}")
+        return None
+
+    finally:
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    print(f"\n✅ Skill '{skill_name}' installed at {skill_dir}")
+    return skill_dir
+
+
+def main():
+    # Default path for ai-rules managed skills
+    DEFAULT_PATH = "ai-rules/skills"
+
+    if len(sys.argv) < 3:
+        print("Usage: install_skill.py <bundle.skills> --list")
+        print("       install_skill.py <bundle.skills> <skill-name> [--path <path>]")
+        print(f"\nDefault path: {DEFAULT_PATH} (recommended for multi-agent support)")
+        print("\nExamples:")
+        print("  install_skill.py dist/catalog.skills --list")
+        print("  install_skill.py dist/catalog.skills my-skill")
+        print("  install_skill.py dist/catalog.skills my-skill --path .cursor/skills")
+        sys.exit(1)
+
+    bundle_path = sys.argv[1]
+
+    if sys.argv[2] == '--list':
+        skills = list_bundle(bundle_path)
+        if skills is None:
+            sys.exit(1)
+        for skill_name in skills:
+            print(skill_name)
+        sys.exit(0)
+
+    skill_name = sys.argv[2]
+
+    # Parse optional --path argument
+    if len(sys.argv) >= 4 and sys.argv[3] == '--path':
+        if len(sys.argv) < 5:
+            print("❌ Error: --path requires a value")
+            print("Usage: install_skill.py <bundle.skills> <skill-name> [--path <path>]")
+            sys.exit(1)
+        path = sys.argv[4]
+    else:
+        path = DEFAULT_PATH
+        if len(sys.argv) > 3:
+            print(f"⚠️  Warning: Unknown argument '{sys.argv[3]}'. Using default path: {DEFAULT_PATH}")
+            print()
+
+    print(f"📥 Installing skill: {skill_name}")
+    print(f"   Bundle: {bundle_path}")
+    print(f"   Location: {path}")
+    if path == DEFAULT_PATH:
+        project_paths = resolve_project_paths()
+        if project_paths is not None:
+            path = str(project_paths.skills)
+    print()
+
+    result = install_skill(bundle_path, skill_name, path)
+
+    if result:
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
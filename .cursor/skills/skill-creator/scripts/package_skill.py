@@ -4,54 +4,257 @@ Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
     python utils/package_skill.py <path/to/skill-folder> [output-directory]
+        [--max-total-size <size>] [--max-compressed-size <size>] [--max-file-size <size>]
+        [--report text|json] [--report-file <path>] [--report-top <n>]
+    python utils/package_skill.py --bundle <output.skills> <skill-folder> [<skill-folder> ...]
+
+A bare skill name (e.g. my-skill) is looked up in the project's ai-rules/skills/.
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --max-compressed-size 1MB --report text
+    python utils/package_skill.py --bundle dist/catalog.skills skills/public/*
+
+Bundles (.skills) pack several skills into one zip. Each distinct file content is
+stored once under blobs/ and addressed by its SHA-256 digest; manifest.json maps
+every skill's relative paths to blob digests. Use install_skill.py to extract a
+single skill from a bundle.
 """
 
 import sys
+import json
+import hashlib
+import argparse
+import contextlib
 import zipfile
 from pathlib import Path
-from quick_validate import validate_skill
+from project_paths import resolve_project_paths
+from quick_validate import StatCache, validate_skill, validate_skill_resources, parse_size, format_size
+
+DEFAULT_REPORT_TOP = 10
+
+BUNDLE_FORMAT = 'skill-bundle'
+BUNDLE_VERSION = 1
+BUNDLE_MANIFEST = 'manifest.json'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Fixed sizes of a zip central directory header and end-of-central-directory record
+ZIP_CENTRAL_HEADER_SIZE = 46
+ZIP_END_RECORD_SIZE = 22
+
+
+class BudgetExceeded(Exception):
+    """Raised when a skill archive goes over one of its size budgets."""
 
 
-def package_skill(skill_path, output_dir=None):
+def check_budget(label, value, limit, path=None):
+    """Raise BudgetExceeded if value is over limit (None disables the budget)."""
+    if limit is not None and value > limit:
+        where = f" at {path}" if path else ""
+        raise BudgetExceeded(
+            f"{label} budget exceeded{where}: {format_size(value)} > {format_size(limit)}"
+        )
+
+
+def archive_size_estimate(zipf):
     """
-    Package a skill folder into a .skill file.
+    Return the size the archive will have on disk if it were closed now.
+
+    Counts everything written so far (local headers and file data) plus the
+    central directory and end record that closing the archive appends.
+    """
+    central_directory = sum(
+        ZIP_CENTRAL_HEADER_SIZE + len(info.filename.encode('utf-8')) + len(info.extra) + len(info.comment)
+        for info in zipf.infolist()
+    )
+    return zipf.fp.tell() + central_directory + ZIP_END_RECORD_SIZE
+
+
+def build_size_report(archive_path, entries, top=DEFAULT_REPORT_TOP, kind='skill'):
+    """
+    Summarize an archive's size and its largest contributors.
 
     Args:
-        skill_path: Path to the skill folder
-        output_dir: Optional output directory for the .skill file (defaults to current directory)
+        archive_path: Path to the created archive
+        entries: List of (arcname, size, compressed_size) tuples
+        top: Number of largest files to include (0 for all)
+        kind: 'skill' for a .skill archive, or 'bundle' when entries are bundle blobs
 
     Returns:
-        Path to the created .skill file, or None if error
+        Report dictionary suitable for JSON output
+    """
+    total_size = sum(size for _, size, _ in entries)
+    compressed_size = sum(compressed for _, _, compressed in entries)
+    largest = sorted(entries, key=lambda entry: (-entry[1], entry[0]))
+    if top:
+        largest = largest[:top]
+
+    return {
+        'archive': str(archive_path),
+        'kind': kind,
+        'archive_size': Path(archive_path).stat().st_size,
+        'file_count': len(entries),
+        'total_size': total_size,
+        'compressed_size': compressed_size,
+        'ratio': round(compressed_size / total_size, 3) if total_size else 1.0,
+        'largest_files': [
+            {
+                'path': arcname,
+                'size': size,
+                'compressed_size': compressed,
+                'ratio': round(compressed / size, 3) if size else 1.0,
+            }
+            for arcname, size, compressed in largest
+        ],
+    }
+
+
+def format_size_report(report):
+    """Render a size report as a plain-text table."""
+    count_label = 'Blobs' if report['kind'] == 'bundle' else 'Files'
+    lines = [
+        f"Size report for {report['archive']}",
+        f"  {count_label}: {report['file_count']}",
+        f"  Uncompressed: {format_size(report['total_size'])}",
+        f"  Compressed: {format_size(report['compressed_size'])} ({report['ratio']:.0%})",
+        f"  Archive on disk: {format_size(report['archive_size'])}",
+        "",
+        f"  {'Size':>10}  {'Compressed':>10}  {'Ratio':>6}  Path",
+    ]
+    for entry in report['largest_files']:
+        lines.append(
+            f"  {format_size(entry['size']):>10}  {format_size(entry['compressed_size']):>10}  "
+            f"{entry['ratio']:>6.0%}  {entry['path']}"
+        )
+    return '\n'.join(lines)
+
+
+def write_size_report(report, report_format, report_file=None, report_stream=None):
     """
-    skill_path = Path(skill_path).resolve()
+    Write a size report as text or JSON.
+
+    The report goes to report_file if given, otherwise to report_stream
+    (default: stdout).
+    """
+    if report_format == 'json':
+        output = json.dumps(report, indent=2)
+    else:
+        output = format_size_report(report)
+
+    if report_file:
+        Path(report_file).write_text(output + '\n')
+        print(f"📝 Wrote size report to: {report_file}")
+    else:
+        stream = report_stream or sys.stdout
+        if report_format != 'json':
+            print(file=stream)
+        print(output, file=stream)
+
+
+def file_digest(file_path):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_name(digest):
+    """Return the archive member name of a content blob in a bundle."""
+    return f"blobs/{digest[:2]}/{digest}"
+
+
+def resolve_skill_path(skill_path):
+    """
+    Resolve a skill folder argument.
+
+    A bare skill name that is not a path relative to the current directory is
+    looked up in the project's ai-rules/skills/ directory.
+    """
+    path = Path(skill_path)
+    if not path.exists() and len(path.parts) == 1:
+        project_paths = resolve_project_paths()
+        if project_paths is not None and (project_paths.skills / path).is_dir():
+            path = project_paths.skills / path
+    return path.resolve()
+
+
+def check_skill(skill_path, stat_cache=None):
+    """
+    Run the pre-packaging checks for a skill folder, printing any problems.
+
+    Args:
+        skill_path: Resolved path to the skill folder
+        stat_cache: Optional StatCache shared with the caller
+
+    Returns:
+        True if the skill can be packaged
+    """
+    stat_cache = stat_cache or StatCache()
 
     # Validate skill folder exists
-    if not skill_path.exists():
+    if not stat_cache.exists(skill_path):
         print(f"❌ Error: Skill folder not found: {skill_path}")
-        return None
+        return False
 
-    if not skill_path.is_dir():
+    if not stat_cache.is_dir(skill_path):
         print(f"❌ Error: Path is not a directory: {skill_path}")
-        return None
+        return False
 
     # Validate SKILL.md exists
     skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
+    if not stat_cache.exists(skill_md):
         print(f"❌ Error: SKILL.md not found in {skill_path}")
-        return None
+        return False
 
     # Run validation before packaging
     print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
+    valid, message = validate_skill(skill_path, stat_cache)
     if not valid:
         print(f"❌ Validation failed: {message}")
         print("   Please fix the validation errors before packaging.")
+        return False
+
+    errors, warnings = validate_skill_resources(skill_path, stat_cache)
+    if errors:
+        print("❌ Resource validation failed:")
+        for error in errors:
+            print(f"   {error}")
+        print("   Please fix the validation errors before packaging.")
+        return False
+    print(f"✅ {message}")
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    print()
+    return True
+
+
+def package_skill(skill_path, output_dir=None, max_total_bytes=None, max_compressed_bytes=None,
+                  max_file_bytes=None, report_format=None, report_file=None,
+                  report_top=DEFAULT_REPORT_TOP, report_stream=None):
+    """
+    Package a skill folder into a .skill file.
+
+    Args:
+        skill_path: Path to the skill folder
+        output_dir: Optional output directory for the .skill file (defaults to current directory)
+        max_total_bytes: Optional budget for the total uncompressed size
+        max_compressed_bytes: Optional budget for the archive size on disk
+        max_file_bytes: Optional budget for any single file's uncompressed size
+        report_format: Optional size report format ('text' or 'json')
+        report_file: Optional path to write the size report to (defaults to report_stream)
+        report_top: Number of largest files to list in the report (0 for all)
+        report_stream: Stream for the size report when report_file is not given (defaults to stdout)
+
+    Returns:
+        Path to the created .skill file, or None if error
+    """
+    skill_path = resolve_skill_path(skill_path)
+    stat_cache = StatCache()
+    if not check_skill(skill_path, stat_cache):
         return None
-    print(f"✅ {message}\n")
 
     # Determine output location
     skill_name = skill_path.name
@@ -63,42 +266,216 @@ def package_skill(skill_path, output_dir=None):
 
     skill_filename = output_path / f"{skill_name}.skill"
 
-    # Create the .skill file (zip format)
+    # Check uncompressed budgets from file sizes before compressing anything
+    try:
+        files = []
+        total_size = 0
+        for file_path in sorted(skill_path.rglob('*')):
+            if file_path.is_file():
+                # Calculate the relative path within the zip
+                arcname = file_path.relative_to(skill_path.parent)
+                size = stat_cache.size(file_path)
+                check_budget("Per-file size", size, max_file_bytes, arcname)
+                total_size += size
+                check_budget("Total uncompressed size", total_size, max_total_bytes, arcname)
+                files.append((file_path, arcname))
+    except BudgetExceeded as e:
+        print(f"❌ {e}")
+        return None
+
+    # Create the .skill file (zip format), checking the archive size as each file is added
+    entries = []
     try:
         with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+            for file_path, arcname in files:
+                zipf.write(file_path, arcname)
+                info = zipf.infolist()[-1]
+                entries.append((arcname.as_posix(), info.file_size, info.compress_size))
+                print(f"  Added: {arcname}")
+                check_budget("Archive size", archive_size_estimate(zipf), max_compressed_bytes, arcname)
+        archive_size = skill_filename.stat().st_size
+        check_budget("Archive size", archive_size, max_compressed_bytes)
 
-        print(f"\n✅ Successfully packaged skill to: {skill_filename}")
-        return skill_filename
+    except BudgetExceeded as e:
+        skill_filename.unlink(missing_ok=True)
+        print(f"❌ {e}")
+        return None
 
     except Exception as e:
+        skill_filename.unlink(missing_ok=True)
         print(f"❌ Error creating .skill file: {e}")
         return None
 
+    print(f"\n✅ Successfully packaged skill to: {skill_filename}")
+    print(f"   {len(entries)} files, {format_size(total_size)} uncompressed, "
+          f"{format_size(archive_size)} archive")
+
+    if report_format:
+        report = build_size_report(skill_filename, entries, report_top)
+        write_size_report(report, report_format, report_file, report_stream)
+
+    return skill_filename
+
+
+def package_bundle(skill_paths, bundle_path, max_total_bytes=None, max_compressed_bytes=None,
+                   max_file_bytes=None, report_format=None, report_file=None,
+                   report_top=DEFAULT_REPORT_TOP, report_stream=None):
+    """
+    Package several skill folders into a single deduplicated .skills bundle.
+
+    Identical files are stored once as blobs addressed by their SHA-256 digest,
+    and manifest.json maps each skill's relative paths to those digests. Size
+    budgets apply to the bundle as a whole and count each blob once.
+
+    Args:
+        skill_paths: Paths to the skill folders
+        bundle_path: Path of the bundle file to create
+        max_total_bytes: Optional budget for the total uncompressed size of all blobs
+        max_compressed_bytes: Optional budget for the bundle size on disk
+        max_file_bytes: Optional budget for any single file's uncompressed size
+        report_format: Optional size report format ('text' or 'json')
+        report_file: Optional path to write the size report to (defaults to report_stream)
+        report_top: Number of largest blobs to list in the report (0 for all)
+        report_stream: Stream for the size report when report_file is not given (defaults to stdout)
+
+    Returns:
+        Path to the created bundle, or None if error
+    """
+    bundle_path = Path(bundle_path).resolve()
+    stat_cache = StatCache()
+    skills = {}
+    for skill_path in skill_paths:
+        skill_path = resolve_skill_path(skill_path)
+        print(f"📦 {skill_path.name}")
+        if not check_skill(skill_path, stat_cache):
+            return None
+        if skill_path.name in skills:
+            print(f"❌ Error: Duplicate skill name in bundle: {skill_path.name}")
+            return None
+        skills[skill_path.name] = skill_path
+
+    # Hash every file and check uncompressed budgets before compressing anything
+    manifest = {'format': BUNDLE_FORMAT, 'version': BUNDLE_VERSION, 'skills': {}, 'blobs': {}}
+    blobs = {}
+    file_count = 0
+    total_size = 0
+    try:
+        for skill_name, skill_path in skills.items():
+            files = {}
+            for file_path in sorted(skill_path.rglob('*')):
+                if not file_path.is_file():
+                    continue
+                rel_path = file_path.relative_to(skill_path).as_posix()
+                size = stat_cache.size(file_path)
+                check_budget("Per-file size", size, max_file_bytes, f"{skill_name}/{rel_path}")
+                digest = file_digest(file_path)
+                files[rel_path] = digest
+                file_count += 1
+                if digest not in blobs:
+                    blobs[digest] = (file_path, f"{skill_name}/{rel_path}")
+                    manifest['blobs'][digest] = size
+                    total_size += size
+                    check_budget("Total uncompressed size", total_size, max_total_bytes,
+                                 f"{skill_name}/{rel_path}")
+            manifest['skills'][skill_name] = {'files': files}
+    except BudgetExceeded as e:
+        print(f"❌ {e}")
+        return None
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    entries = []
+    try:
+        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # The manifest goes first so readers can list skills without scanning blobs
+            zipf.writestr(BUNDLE_MANIFEST, json.dumps(manifest, indent=2, sort_keys=True))
+            for digest, (file_path, first_path) in blobs.items():
+                zipf.write(file_path, blob_name(digest))
+                info = zipf.infolist()[-1]
+                entries.append((first_path, info.file_size, info.compress_size))
+                check_budget("Archive size", archive_size_estimate(zipf), max_compressed_bytes, first_path)
+        archive_size = bundle_path.stat().st_size
+        check_budget("Archive size", archive_size, max_compressed_bytes)
+
+    except BudgetExceeded as e:
+        bundle_path.unlink(missing_ok=True)
+        print(f"❌ {e}")
+        return None
+
+    except Exception as e:
+        bundle_path.unlink(missing_ok=True)
+        print(f"❌ Error creating bundle: {e}")
+        return None
+
+    print(f"✅ Successfully bundled {len(skills)} skills to: {bundle_path}")
+    print(f"   {file_count} files stored as {len(blobs)} unique blobs, "
+          f"{format_size(total_size)} uncompressed, {format_size(archive_size)} archive")
+
+    if report_format:
+        report = build_size_report(bundle_path, entries, report_top, kind='bundle')
+        write_size_report(report, report_format, report_file, report_stream)
+
+    return bundle_path
+
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Package a skill folder into a distributable .skill file.",
+        usage="package_skill.py <path/to/skill-folder> [output-directory] [options]\n"
+              "       package_skill.py --bundle <output.skills> <skill-folder> [<skill-folder> ...] [options]",
+        epilog="Examples:\n"
+               "  package_skill.py skills/public/my-skill\n"
+               "  package_skill.py skills/public/my-skill ./dist --max-compressed-size 1MB --report text\n"
+               "  package_skill.py --bundle dist/catalog.skills skills/public/*",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('paths', nargs='+', metavar='path',
+                        help="Skill folder and optional output directory, or skill folders with --bundle")
+    parser.add_argument('--bundle', metavar='PATH',
+                        help="Pack all given skill folders into one deduplicated bundle at PATH")
+    parser.add_argument('--max-total-size', type=parse_size, metavar='SIZE',
+                        help="Fail if the total uncompressed size exceeds SIZE (e.g. 5MB)")
+    parser.add_argument('--max-compressed-size', type=parse_size, metavar='SIZE',
+                        help="Fail if the archive file on disk exceeds SIZE")
+    parser.add_argument('--max-file-size', type=parse_size, metavar='SIZE',
+                        help="Fail if any single file exceeds SIZE uncompressed")
+    parser.add_argument('--report', choices=('text', 'json'), dest='report_format',
+                        help="Print a report of the largest files and their compression ratios")
+    parser.add_argument('--report-file', metavar='PATH',
+                        help="Write the size report to PATH instead of stdout")
+    parser.add_argument('--report-top', type=int, default=DEFAULT_REPORT_TOP, metavar='N',
+                        help=f"Number of largest files to report (default: {DEFAULT_REPORT_TOP}, 0 for all)")
+    args = parser.parse_args()
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    options = dict(
+        max_total_bytes=args.max_total_size,
+        max_compressed_bytes=args.max_compressed_size,
+        max_file_bytes=args.max_file_size,
+        report_format=args.report_format,
+        report_file=args.report_file,
+        report_top=args.report_top,
+        report_stream=sys.stdout,
+    )
+    if not args.bundle and len(args.paths) > 2:
+        parser.error("expected <path/to/skill-folder> [output-directory]; use --bundle for several skills")
 
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
-    print()
+    # Keep stdout machine-readable when it carries the JSON report
+    json_to_stdout = args.report_format == 'json' and not args.report_file
+    progress = contextlib.redirect_stdout(sys.stderr) if json_to_stdout else contextlib.nullcontext()
+
+    with progress:
+        if args.bundle:
+            print(f"📦 Bundling {len(args.paths)} skills into: {args.bundle}")
+            print()
+            result = package_bundle(args.paths, args.bundle, **options)
+        else:
+            skill_path = args.paths[0]
+            output_dir = args.paths[1] if len(args.paths) > 1 else None
 
-    result = package_skill(skill_path, output_dir)
+            print(f"📦 Packaging skill: {skill_path}")
+            if output_dir:
+                print(f"   Output directory: {output_dir}")
+            print()
+            result = package_skill(skill_path, output_dir, **options)
 
     if result:
         sys.exit(0)
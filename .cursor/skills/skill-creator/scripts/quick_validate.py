@@ -1,42 +1,268 @@
 #!/usr/bin/env python3
 """
-Quick validation script for skills - minimal version
+Quick validation script for skills, commands and workflows - minimal version
+
+Usage:
+    quick_validate.py <path> [<path> ...] [--type skill|command|workflow]
+                      [--resources] [--max-resource-size <size>] [--jobs <n>]
+    quick_validate.py --all [--root <project-root>] [--resources] [--jobs <n>]
+
+Directories are validated as skills, `*.md` files under a `commands/` directory
+as commands and under a `workflows/` directory as workflows. --all discovers
+every skill, command and workflow under `.agents`, `.cursor`, `.devagent` and
+`ai-rules` and checks them in parallel.
+
+Each artifact type has its own rule set (see RULES). All rule sets share one
+single-pass Markdown parser and one cache of stat results and parsed files, so
+a file linked from several places is read once per run.
+
+With --resources, SKILL.md links and `scripts/`, `references/`, `assets/`
+paths are resolved against the skill directory, and bundled files are checked
+for broken links, unreferenced files and oversized resources.
 """
 
 import sys
 import os
 import re
+import stat
+import time
+import argparse
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import unquote
+from project_paths import resolve_project_paths
+
+ERROR = 'error'
+WARNING = 'warning'
+
+ARTIFACT_TYPES = ('skill', 'command', 'workflow')
+
+# Where each artifact type lives, relative to the project root (glob patterns)
+ARTIFACT_LOCATIONS = {
+    'skill': ('ai-rules/skills', '.cursor/skills', '.devagent/plugins/*/skills'),
+    'command': ('.agents/commands', 'ai-rules/commands', '.cursor/commands',
+                '.devagent/core/commands', '.devagent/plugins/*/commands'),
+    'workflow': ('.devagent/core/workflows', '.devagent/plugins/*/workflows'),
+}
+NON_ARTIFACT_FILES = {'README.md'}
+
+# Bundled resource directories created by init_skill.py
+RESOURCE_DIRS = ('scripts', 'references', 'assets')
+IGNORED_NAMES = {'__pycache__', '.DS_Store'}
+DEFAULT_MAX_RESOURCE_BYTES = 5 * 1024 * 1024
+
+# Frontmatter keys understood by agent slash commands
+ALLOWED_COMMAND_PROPERTIES = {'description', 'argument-hint', 'allowed-tools', 'model',
+                              'disable-model-invocation'}
+
+HYPHEN_CASE_RE = re.compile(r'^[a-z0-9-]+$')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+WORKFLOW_REF_RE = re.compile(r'(\.devagent/(?:[\w.-]+/)*workflows/[\w.-]+\.md)')
+MARKDOWN_LINK_RE = re.compile(r'!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+# A path token such as `scripts/x.py` or `.cursor/skills/foo/scripts/x.py`; group 1
+# is the part from the resource directory on, i.e. the skill-relative path
+RESOURCE_PATH_RE = re.compile(
+    r'(?<![\w./~:-])(?:[\w.~-]+/)*((?:%s)/[\w./-]*[\w-])' % '|'.join(RESOURCE_DIRS)
+)
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+URL_SCHEME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([kmg]?i?b?)?\s*$', re.IGNORECASE)
+SIZE_UNITS = {'': 1, 'b': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+
+
+class MarkdownDocument:
+    """Frontmatter, headings and body of a Markdown file, read in a single pass."""
+
+    def __init__(self, path):
+        self.path = path
+        # 'ok', 'missing' (no leading ---), or 'invalid' (unterminated or malformed)
+        self.frontmatter_status = 'missing'
+        self.frontmatter_text = None
+        self.title = None
+        self.headings = []
+        self.body_lines = []
+
+    @property
+    def body(self):
+        return ''.join(self.body_lines)
+
+    def has_heading(self, text, level=2):
+        return (level, text) in self.headings
+
+    def load_frontmatter(self):
+        """
+        Parse the YAML frontmatter.
+
+        Returns:
+            Tuple of (data, error message); data is None when there is no valid frontmatter
+        """
+        if self.frontmatter_status == 'missing':
+            return None, "No YAML frontmatter found"
+        if self.frontmatter_status == 'invalid':
+            return None, "Invalid frontmatter format"
+        try:
+            data = yaml.safe_load(self.frontmatter_text)
+        except yaml.YAMLError as e:
+            return None, f"Invalid YAML in frontmatter: {e}"
+        if not isinstance(data, dict):
+            return None, "Frontmatter must be a YAML dictionary"
+        return data, None
+
+
+def parse_markdown(path):
+    """
+    Read a Markdown file line by line into a MarkdownDocument.
+
+    Headings inside fenced code blocks are ignored; the first level-1 heading
+    is the document title.
+    """
+    doc = MarkdownDocument(path)
+    with open(path, encoding='utf-8') as f:
+        first = f.readline()
+        if first.startswith('---'):
+            doc.frontmatter_status = 'invalid'
+            if first.rstrip('\n') == '---':
+                lines = []
+                for line in f:
+                    if line.startswith('---'):
+                        doc.frontmatter_status = 'ok'
+                        doc.frontmatter_text = ''.join(lines).rstrip('\n')
+                        break
+                    lines.append(line)
+                else:
+                    # Unterminated frontmatter: keep the lines as body text
+                    doc.body_lines = [first] + lines
+        else:
+            f.seek(0)
+
+        in_fence = False
+        for line in f:
+            doc.body_lines.append(line)
+            if FENCE_RE.match(line):
+                in_fence = not in_fence
+                continue
+            if in_fence or not line.startswith('#'):
+                continue
+            match = HEADING_RE.match(line.rstrip('\n'))
+            if match:
+                heading = (len(match.group(1)), match.group(2))
+                doc.headings.append(heading)
+                if heading[0] == 1 and doc.title is None:
+                    doc.title = heading[1]
+    return doc
+
+
+class StatCache:
+    """
+    Memoize filesystem lookups so a bulk run stats and parses each path only once.
+
+    Safe to share between the threads of a bulk run: entries are only ever
+    added, so a race at worst repeats a lookup.
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._listings = {}
+        self._documents = {}
+
+    def stat(self, path):
+        """Return os.stat() for path, or None if it does not exist."""
+        key = os.fspath(path)
+        if key not in self._stats:
+            try:
+                self._stats[key] = os.stat(key)
+            except OSError:
+                self._stats[key] = None
+        return self._stats[key]
+
+    def exists(self, path):
+        return self.stat(path) is not None
+
+    def is_dir(self, path):
+        st = self.stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def is_file(self, path):
+        st = self.stat(path)
+        return st is not None and stat.S_ISREG(st.st_mode)
 
-def validate_skill(skill_path):
+    def size(self, path):
+        st = self.stat(path)
+        return st.st_size if st is not None else 0
+
+    def list_files(self, root):
+        """
+        Return every regular file below root, skipping caches and junk files.
+
+        Like the packager's rglob, symlinks to files are listed but symlinked
+        directories are not descended into, so a link cycle cannot loop.
+        """
+        key = os.fspath(root)
+        if key not in self._listings:
+            files = []
+            pending = [key]
+            while pending:
+                current = pending.pop()
+                try:
+                    with os.scandir(current) as entries:
+                        entries = list(entries)
+                except OSError:
+                    continue
+                for entry in entries:
+                    if entry.name in IGNORED_NAMES or entry.name.endswith('.pyc'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif self.is_file(entry.path):
+                        files.append(entry.path)
+            self._listings[key] = sorted(files)
+        return self._listings[key]
+
+    def document(self, path):
+        """Return the parsed MarkdownDocument for path, keyed by its real path."""
+        key = os.path.realpath(path)
+        st = self.stat(key)
+        cache_key = (key, st.st_mtime_ns, st.st_size) if st is not None else (key,)
+        if cache_key not in self._documents:
+            self._documents[cache_key] = parse_markdown(key)
+        return self._documents[cache_key]
+
+
+def parse_size(value):
+    """Parse a human-readable size such as '512K', '5MB' or '1.5GiB' into bytes."""
+    match = SIZE_RE.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    number, unit = match.groups()
+    unit = (unit or '').lower().rstrip('b').rstrip('i') or ''
+    return int(float(number) * SIZE_UNITS[unit])
+
+
+def format_size(num_bytes):
+    """Format a byte count for display (e.g. '1.2 MB')."""
+    size = float(num_bytes)
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def validate_skill(skill_path, stat_cache=None):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
+    cache = stat_cache if stat_cache is not None else StatCache()
 
     # Check SKILL.md exists
     skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
+    if not cache.is_file(skill_md):
         return False, "SKILL.md not found"
 
     # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
-
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
-
-    frontmatter_text = match.group(1)
-
-    # Parse YAML frontmatter
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+    frontmatter, error = cache.document(skill_md).load_frontmatter()
+    if error:
+        return False, error
 
     # Define allowed properties
     ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
@@ -85,11 +311,389 @@ def validate_skill(skill_path):
 
     return True, "Skill is valid!"
 
+
+def extract_resource_references(body):
+    """
+    Extract relative file references from a SKILL.md body.
+
+    Links inside fenced code blocks usually show examples of other skills, so
+    only resource paths (e.g. `scripts/foo.py` in a shell command) are taken
+    from them.
+
+    Returns:
+        List of (target, kind) tuples, where kind is 'link' for Markdown links
+        and 'mention' for scripts/, references/ or assets/ paths anywhere in
+        the text: prose, inline code with arguments, or fenced commands.
+        Paths under another prefix (e.g. `.cursor/skills/x/scripts/y.py`) are
+        reduced to their skill-relative part.
+    """
+    references = []
+    in_fence = False
+    for line in body.splitlines():
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            for target in MARKDOWN_LINK_RE.findall(line):
+                references.append((target, 'link'))
+        for target in RESOURCE_PATH_RE.findall(line):
+            references.append((target, 'mention'))
+
+    relative = []
+    for target, kind in references:
+        target = unquote(target.split('#', 1)[0].split('?', 1)[0]).strip()
+        if not target or URL_SCHEME_RE.match(target) or target.startswith(('/', '~')):
+            continue
+        if (target, kind) not in relative:
+            relative.append((target, kind))
+    return relative
+
+
+def validate_skill_resources(skill_path, stat_cache=None, max_resource_bytes=DEFAULT_MAX_RESOURCE_BYTES):
+    """
+    Check the files referenced from SKILL.md against the files bundled with the skill.
+
+    Args:
+        skill_path: Path to the skill folder
+        stat_cache: Optional StatCache shared across skills in a bulk run
+        max_resource_bytes: Size above which a bundled file is reported (0 disables)
+
+    Returns:
+        Tuple of (errors, warnings). Broken Markdown links are errors;
+        unreferenced bundled files and oversized resources are warnings. Paths
+        mentioned outside links are often illustrative (`scripts/rotate_pdf.py`
+        as an example of a script), so they only mark files as used and are
+        never reported as missing.
+    """
+    # Resolve symlinks so skills linked into several agent directories share cache entries
+    skill_path = Path(skill_path).resolve()
+    cache = stat_cache if stat_cache is not None else StatCache()
+    errors, warnings = [], []
+
+    skill_md = skill_path / 'SKILL.md'
+    if not cache.is_file(skill_md):
+        return ["SKILL.md not found"], []
+
+    referenced = set()
+    for target, kind in extract_resource_references(cache.document(skill_md).body):
+        resolved = os.path.normpath(skill_path / target)
+        if not cache.exists(resolved):
+            if kind == 'link':
+                errors.append(f"Broken link in SKILL.md: {target}")
+            continue
+        referenced.add(resolved)
+
+    for dirname in RESOURCE_DIRS:
+        for file_path in cache.list_files(skill_path / dirname):
+            rel_path = Path(file_path).relative_to(skill_path).as_posix()
+            covered = any(
+                file_path == ref or file_path.startswith(ref + os.sep)
+                for ref in referenced
+            )
+            if not covered:
+                warnings.append(f"Unreferenced bundled file: {rel_path}")
+            size = cache.size(file_path)
+            if max_resource_bytes and size > max_resource_bytes:
+                warnings.append(
+                    f"Oversized resource: {rel_path} "
+                    f"({format_size(size)} > {format_size(max_resource_bytes)})"
+                )
+
+    return errors, warnings
+
+
+class ValidationContext:
+    """Settings and caches shared by every rule in a validation run."""
+
+    def __init__(self, project_root=None, stat_cache=None, resources=False,
+                 max_resource_bytes=DEFAULT_MAX_RESOURCE_BYTES):
+        self.project_root = Path(project_root) if project_root else None
+        self.cache = stat_cache if stat_cache is not None else StatCache()
+        self.resources = resources
+        self.max_resource_bytes = max_resource_bytes
+
+
+# Rule sets per artifact type. A rule takes (path, doc, ctx) and yields
+# (level, message) tuples; register new rules with the @rule decorator.
+RULES = {artifact_type: [] for artifact_type in ARTIFACT_TYPES}
+
+
+def rule(artifact_type):
+    """Register a validation rule for an artifact type."""
+    def register(func):
+        RULES[artifact_type].append(func)
+        return func
+    return register
+
+
+def check_optional_frontmatter(doc, allowed_keys=None):
+    """Yield issues for frontmatter that is present but malformed."""
+    if doc.frontmatter_status == 'missing':
+        return
+    frontmatter, error = doc.load_frontmatter()
+    if error:
+        yield ERROR, error
+        return
+    if allowed_keys is not None:
+        unexpected_keys = set(frontmatter) - allowed_keys
+        if unexpected_keys:
+            yield ERROR, (
+                f"Unexpected key(s) in frontmatter: {', '.join(sorted(unexpected_keys))}. "
+                f"Allowed properties are: {', '.join(sorted(allowed_keys))}"
+            )
+    description = frontmatter.get('description')
+    if description is not None and not isinstance(description, str):
+        yield ERROR, f"Description must be a string, got {type(description).__name__}"
+
+
+@rule('skill')
+def skill_frontmatter_rule(path, doc, ctx):
+    valid, message = validate_skill(path, ctx.cache)
+    if not valid:
+        yield ERROR, message
+
+
+@rule('skill')
+def skill_resources_rule(path, doc, ctx):
+    if not ctx.resources:
+        return
+    errors, warnings = validate_skill_resources(path, ctx.cache, ctx.max_resource_bytes)
+    for error in errors:
+        yield ERROR, error
+    for warning in warnings:
+        yield WARNING, warning
+
+
+@rule('command')
+def command_frontmatter_rule(path, doc, ctx):
+    yield from check_optional_frontmatter(doc, ALLOWED_COMMAND_PROPERTIES)
+
+
+@rule('command')
+def command_name_rule(path, doc, ctx):
+    name = Path(path).stem
+    if not HYPHEN_CASE_RE.match(name) or name.startswith('-') or name.endswith('-') or '--' in name:
+        yield ERROR, f"Command name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+
+
+@rule('command')
+def command_structure_rule(path, doc, ctx):
+    if doc.title is None:
+        yield ERROR, "Missing '# <Title> (Command)' heading"
+    elif not doc.title.endswith('(Command)'):
+        yield ERROR, f"Title '{doc.title}' should end with '(Command)'"
+    if not doc.has_heading('Instructions'):
+        yield ERROR, "Missing '## Instructions' section"
+    if '**Input Context:**' not in doc.body:
+        yield ERROR, "Missing '**Input Context:**' marker"
+
+
+@rule('command')
+def command_workflow_rule(path, doc, ctx):
+    references = sorted(set(WORKFLOW_REF_RE.findall(doc.body)))
+    if not references:
+        yield WARNING, "No .devagent workflow referenced"
+        return
+    if ctx.project_root is None:
+        return
+    for reference in references:
+        if not ctx.cache.is_file(ctx.project_root / reference):
+            yield ERROR, f"Referenced workflow not found: {reference}"
+
+
+@rule('workflow')
+def workflow_frontmatter_rule(path, doc, ctx):
+    yield from check_optional_frontmatter(doc)
+
+
+@rule('workflow')
+def workflow_structure_rule(path, doc, ctx):
+    if doc.title is None:
+        yield ERROR, "Missing '# <Title>' heading"
+    if not (doc.has_heading('Mission') or doc.has_heading('Purpose & Scope')):
+        yield ERROR, "Missing '## Mission' or '## Purpose & Scope' section"
+    if not doc.has_heading('Workflow'):
+        yield ERROR, "Missing '## Workflow' section"
+    if not doc.has_heading('Standard Instructions Reference'):
+        yield WARNING, "Missing '## Standard Instructions Reference' section"
+
+
+def artifact_document_path(artifact_type, path):
+    """Return the Markdown file that defines an artifact."""
+    return Path(path) / 'SKILL.md' if artifact_type == 'skill' else Path(path)
+
+
+def validate_artifact(artifact_type, path, ctx):
+    """
+    Run the rule set for one artifact.
+
+    Returns:
+        Tuple of (errors, warnings)
+    """
+    path = Path(path)
+    if path.is_symlink() and not ctx.cache.exists(path):
+        return [f"Broken symlink to {os.readlink(path)}"], []
+
+    doc_path = artifact_document_path(artifact_type, path)
+    if not ctx.cache.is_file(doc_path):
+        return [f"{doc_path.name} not found"], []
+
+    try:
+        doc = ctx.cache.document(doc_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return [f"Could not read {doc_path.name}: {e}"], []
+
+    errors, warnings = [], []
+    for check in RULES[artifact_type]:
+        for level, message in check(path, doc, ctx):
+            (errors if level == ERROR else warnings).append(message)
+    return errors, warnings
+
+
+def infer_artifact_type(path):
+    """
+    Guess the artifact type from a path, or return None.
+
+    Anything that is not a Markdown file is treated as a skill folder, so a
+    missing skill path is reported by the skill checks rather than here.
+    """
+    path = Path(path)
+    if path.suffix != '.md' or path.is_dir():
+        return 'skill'
+    if path.parent.name == 'commands':
+        return 'command'
+    if path.parent.name == 'workflows':
+        return 'workflow'
+    return None
+
+
+def discover_artifacts(project_root):
+    """
+    Find every skill, command and workflow under a project root.
+
+    Artifacts reached through several symlinks are returned once.
+
+    Returns:
+        List of (artifact_type, path) tuples
+    """
+    project_root = Path(project_root)
+    artifacts = []
+    seen = set()
+    for artifact_type in ARTIFACT_TYPES:
+        for pattern in ARTIFACT_LOCATIONS[artifact_type]:
+            for location in sorted(project_root.glob(pattern)):
+                if not location.is_dir():
+                    continue
+                for entry in sorted(location.iterdir()):
+                    if artifact_type == 'skill':
+                        if not (entry.is_dir() or entry.is_symlink()):
+                            continue
+                    elif entry.suffix != '.md' or entry.name in NON_ARTIFACT_FILES:
+                        continue
+                    key = (artifact_type, os.path.realpath(entry))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    artifacts.append((artifact_type, entry))
+    return artifacts
+
+
+def run_validation(artifacts, ctx, jobs=None):
+    """
+    Validate artifacts in parallel.
+
+    Returns:
+        List of (artifact_type, path, errors, warnings) in input order
+    """
+    def validate(artifact):
+        artifact_type, path = artifact
+        return (artifact_type, path) + validate_artifact(artifact_type, path, ctx)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(validate, artifacts))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate skills, commands and workflows.",
+        usage="quick_validate.py <path> [<path> ...] [--type skill|command|workflow] [options]\n"
+              "       quick_validate.py --all [--root <project-root>] [options]",
+    )
+    parser.add_argument('paths', nargs='*', metavar='path')
+    parser.add_argument('--type', choices=ARTIFACT_TYPES, dest='artifact_type',
+                        help="Artifact type of the given paths (inferred by default)")
+    parser.add_argument('--all', action='store_true',
+                        help="Validate every skill, command and workflow in the project")
+    parser.add_argument('--root', metavar='PATH',
+                        help="Project root (default: DEVAGENT_PROJECT_ROOT, or found from the paths or cwd)")
+    parser.add_argument('--resources', action='store_true',
+                        help="Also check referenced, unreferenced and oversized bundled files")
+    parser.add_argument('--max-resource-size', type=parse_size,
+                        default=DEFAULT_MAX_RESOURCE_BYTES, metavar='SIZE',
+                        help="Report bundled files larger than SIZE (default: 5MB, 0 disables)")
+    parser.add_argument('--jobs', type=int, metavar='N',
+                        help="Number of parallel workers (default: Python's thread pool default)")
+    args = parser.parse_args()
+
+    if not args.all and not args.paths:
+        parser.error("provide one or more paths, or --all")
+
+    project_root = args.root
+    if project_root is None:
+        start = Path(args.paths[0]).resolve() if args.paths else Path.cwd()
+        project_paths = resolve_project_paths(start if start.is_dir() else start.parent)
+        project_root = project_paths.root if project_paths else None
+    if args.all and project_root is None:
+        parser.error("could not find the project root; pass --root or set DEVAGENT_PROJECT_ROOT")
+
+    artifacts = []
+    if args.all:
+        artifacts.extend(discover_artifacts(project_root))
+    for path in args.paths:
+        artifact_type = args.artifact_type or infer_artifact_type(path)
+        if artifact_type is None:
+            parser.error(f"cannot infer the artifact type of {path}; pass --type")
+        artifacts.append((artifact_type, Path(path)))
+
+    ctx = ValidationContext(project_root, StatCache(), args.resources, args.max_resource_size)
+    started = time.perf_counter()
+    results = run_validation(artifacts, ctx, args.jobs)
+    elapsed = time.perf_counter() - started
+
+    multiple = len(results) > 1
+    error_count = warning_count = 0
+    for artifact_type, path, errors, warnings in results:
+        error_count += len(errors)
+        warning_count += len(warnings)
+        # Bulk runs only list artifacts with problems
+        if args.all and not errors and not warnings:
+            continue
+
+        prefix = f"{os.path.relpath(path)}: " if multiple else ""
+        if not errors:
+            message = f"{artifact_type.capitalize()} is valid!"
+        elif len(errors) == 1:
+            message = errors.pop()
+        else:
+            message = f"{len(errors)} errors"
+        print(f"{prefix}{message}")
+        for error in errors:
+            print(f"  ❌ {error}")
+        for warning in warnings:
+            print(f"  ⚠️  {warning}")
+
+    if multiple:
+        counts = ', '.join(
+            f"{count} {artifact_type}{'s' if count != 1 else ''}"
+            for artifact_type in ARTIFACT_TYPES
+            for count in [sum(1 for result in results if result[0] == artifact_type)]
+            if count
+        )
+        print(f"\nChecked {len(results)} artifacts ({counts}) in {elapsed:.2f}s: "
+              f"{error_count} error(s), {warning_count} warning(s)")
+
+    sys.exit(0 if error_count == 0 else 1)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
-        sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+    main()